@@ -2,13 +2,13 @@
 Example demonstrating dynamic agent creation and registration during runtime.
 """
 import os
+from collections import deque
 from typing import Dict, Any
 from moya.agents.openai_agent import OpenAIAgent, OpenAIAgentConfig
 from moya.agents.openai_agent import OpenAIAgent, OpenAIAgentConfig
 from moya.classifiers.llm_classifier import LLMClassifier
 from moya.orchestrators.multi_agent_orchestrator import MultiAgentOrchestrator
 from moya.registry.agent_registry import AgentRegistry
-from moya.tools.memory_tool import MemoryTool
 from moya.memory.in_memory_repository import InMemoryRepository
 from moya.tools.tool_registry import ToolRegistry
 from moya.tools.base_tool import BaseTool
@@ -16,8 +16,6 @@ from moya.tools.ephemeral_memory import EphemeralMemory
 
 def setup_memory_components():
     """Set up shared memory components."""
-   # memory_repo = InMemoryRepository()
-   # memory_tool = MemoryTool(memory_repository=memory_repo)
     tool_registry = ToolRegistry()
     EphemeralMemory.configure_memory_tools(tool_registry)
     tool_registry.register_tool(BaseTool(name="ReverseTool", function=reverse_text_tool))
@@ -46,7 +44,7 @@ def create_initial_classifier() -> OpenAIAgent:
         agent_type="OpenAIAgent",
         description="Dynamic message router",
         system_prompt=system_prompt,
-        model_name="gpt-4o",
+        model_name="gpt-4o-mini",  # Routing is a single-label decision; a small model is enough
        # tool_registry=setup_memory_components(),
         api_key=os.getenv("OPENAI_API_KEY")
     )
@@ -101,11 +99,11 @@ def create_new_agent(tool_registry, agents_info: Dict[str, Dict[str, Any]]) -> O
 
 def format_conversation_context(messages):
     """Format conversation history for context."""
-    context = "\nPrevious conversation:\n"
+    lines = []
     for msg in messages:
-        sender = "User" if msg.sender == "user" else "Assistant"
-        context += f"{sender}: {msg.content}\n"
-    return context
+        sender = "User" if msg["role"] == "user" else "Assistant"
+        lines.append(f"{sender}: {msg['content']}\n")
+    return "\nPrevious conversation:\n" + "".join(lines)
 
 
 def main():
@@ -150,6 +148,11 @@ def main():
     print("Type 'Create new agent' to add a new agent to the system")
     print("-" * 50)
 
+    # Recent raw turns for the prompt context. MultiAgentOrchestrator already stores
+    # every turn in EphemeralMemory, but it stores the context-enriched prompt, so
+    # reading those back would nest all earlier context inside each new prompt
+    recent_messages = deque(maxlen=5)
+
     def stream_callback(chunk):
         print(chunk, end="", flush=True)
 
@@ -172,34 +175,9 @@ def main():
             print(f"\nAgent '{new_agent.agent_name}' created and registered!")
             continue
 
-        # Get available agents
-        agents = registry.list_agents()
-        if not agents:
-            print("\nNo agents available!")
-            continue
-
-        # Get the last used agent or default to the first one
-        last_agent = registry.get_agent(agents[0].name)
-
-        # Store the user message first
-        if last_agent.tool_registry:
-            try:
-                last_agent.call_tool(
-                    tool_name="MemoryTool",
-                    method_name="store_message",
-                    thread_id=thread_id,
-                    sender="user",
-                    content=user_message
-                )
-            except Exception as e:
-                print(f"Error storing user message: {e}")
-
-        # Get conversation context
-        previous_messages = last_agent.get_last_n_messages(thread_id, n=5)
-
         # Add context to the user's message if there are previous messages
-        if previous_messages:
-            context = format_conversation_context(previous_messages)
+        if recent_messages:
+            context = format_conversation_context(recent_messages)
             enhanced_input = f"{context}\nCurrent user message: {user_message}"
         else:
             enhanced_input = user_message
@@ -213,6 +191,9 @@ def main():
         )
         print()
 
+        recent_messages.append({"role": "user", "content": user_message})
+        recent_messages.append({"role": "assistant", "content": response})
+
 
 if __name__ == "__main__":
     main()
@@ -2,6 +2,7 @@
 Interactive chat example using BedrockAgent with conversation memory.
 """
 
+from collections import deque
 from moya.memory.in_memory_repository import InMemoryRepository
 from moya.tools.tool_registry import ToolRegistry
 from moya.registry.agent_registry import AgentRegistry
@@ -48,12 +49,13 @@ def setup_agent():
     return orchestrator, agent
 
 
-def format_conversation_context(messages):
-    context = "\nPrevious conversation:\n"
-    for msg in messages:
-        sender = "User" if msg.sender == "user" else "Assistant"
-        context += f"{sender}: {msg.content}\n"
-    return context
+def format_message_line(sender, content):
+    sender = "User" if sender == "user" else "Assistant"
+    return f"{sender}: {content}\n"
+
+
+def format_conversation_context(lines):
+    return "\nPrevious conversation:\n" + "".join(lines)
 
 
 def main():
@@ -63,6 +65,9 @@ def main():
     print("Welcome to Bedrock Interactive Chat! (Type 'quit' or 'exit' to end)")
     print("-" * 50)
 
+    # Formatted lines for the last 5 messages, kept up to date as messages are stored
+    recent_lines = deque(maxlen=5)
+
     while True:
         user_input = input("\nYou: ").strip()
 
@@ -72,16 +77,11 @@ def main():
 
         # Store the user message
         EphemeralMemory.store_message(thread_id=thread_id, sender="user", content=user_input)
-
-        # Get conversation context
-        previous_messages = agent.get_last_n_messages(thread_id, n=5)
+        recent_lines.append(format_message_line("user", user_input))
 
         # Add context to the user's message
-        if previous_messages:
-            context = format_conversation_context(previous_messages)
-            enhanced_input = f"{context}\nCurrent user message: {user_input}"
-        else:
-            enhanced_input = user_input
+        context = format_conversation_context(recent_lines)
+        enhanced_input = f"{context}\nCurrent user message: {user_input}"
 
         print("\nAssistant: ", end="", flush=True)
 
@@ -94,6 +94,7 @@ def main():
 
         # Store the assistant's response
         EphemeralMemory.store_message(thread_id=thread_id, sender="assistant", content=response)
+        recent_lines.append(format_message_line("assistant", response))
 
 
 if __name__ == "__main__":
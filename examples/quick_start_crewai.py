@@ -3,9 +3,9 @@ Interactive chat example using OpenAI agent with conversation memory.
 """
 
 import os
-from moya.memory.in_memory_repository import InMemoryRepository
+import json
 from moya.tools.tool_registry import ToolRegistry
-from moya.tools.memory_tool import MemoryTool
+from moya.tools.ephemeral_memory import EphemeralMemory
 from moya.registry.agent_registry import AgentRegistry
 from moya.orchestrators.simple_orchestrator import SimpleOrchestrator
 from moya.agents.crewai_agent import CrewAIAgent, CrewAIAgentConfig
@@ -13,20 +13,20 @@ from moya.agents.crewai_agent import CrewAIAgent, CrewAIAgentConfig
 
 def setup_agent():
     # Set up memory components
-    memory_repo = InMemoryRepository()
-    memory_tool = MemoryTool(memory_repository=memory_repo)
     tool_registry = ToolRegistry()
-    tool_registry.register_tool(memory_tool)
+    EphemeralMemory.configure_memory_tools(tool_registry)
 
     # Create OpenAI agent with memory capabilities
     agent = CrewAIAgent(
-        agent_name="eli5_agent",
-        description="An intelligent agent that can explain things to a five year old.",
-        agent_config=CrewAIAgentConfig(system_prompt="Can you explain this to me like I'm five?",
-                                       api_key=os.environ.get("OPENAI_API_KEY"),
-                                       model_name="gpt-4o"
-                                       ),
-        tool_registry=tool_registry
+        config=CrewAIAgentConfig(
+            agent_name="eli5_agent",
+            agent_type="CrewAIAgent",
+            description="An intelligent agent that can explain things to a five year old.",
+            system_prompt="Can you explain this to me like I'm five?",
+            api_key=os.environ.get("OPENAI_API_KEY"),
+            model_name="gpt-4o",
+            tool_registry=tool_registry
+        )
     )
     agent.setup()
 
@@ -42,12 +42,11 @@ def setup_agent():
 
 
 def format_conversation_context(messages):
-    context = "\nPrevious conversation:\n"
+    lines = []
     for msg in messages:
-        # Access Message object attributes properly using dot notation
-        sender = "User" if msg.sender == "user" else "Assistant"
-        context += f"{sender}: {msg.content}\n"
-    return context
+        sender = "User" if msg["role"] == "user" else "Assistant"
+        lines.append(f"{sender}: {msg['content']}\n")
+    return "\nPrevious conversation:\n" + "".join(lines)
 
 
 def main():
@@ -66,17 +65,10 @@ def main():
             print("\nGoodbye!")
             break
 
-        # Store the user message first
-        agent.call_tool(
-            tool_name="MemoryTool",
-            method_name="store_message",
-            thread_id=thread_id,
-            sender="user",
-            content=user_input
-        )
-
-        # Get conversation context
-        previous_messages = agent.get_last_n_messages(thread_id, n=5)
+        # Store the user message and get conversation context in one call
+        previous_messages = json.loads(EphemeralMemory.store_message_and_get_last_n(
+            thread_id=thread_id, sender="user", content=user_input, n=5
+        ))
 
         # Add context to the user's message if there are previous messages
         if previous_messages:
@@ -103,13 +95,7 @@ def main():
         print()
 
         # Store the assistant's response
-        agent.call_tool(
-            tool_name="MemoryTool",
-            method_name="store_message",
-            thread_id=thread_id,
-            sender="assistant",
-            content=response
-        )
+        EphemeralMemory.store_message(thread_id=thread_id, sender="assistant", content=response)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,7 @@
 import os
+import re
+from collections import deque
+from openai import OpenAI
 from moya.agents.openai_agent import OpenAIAgent, OpenAIAgentConfig
 from moya.agents.remote_agent import RemoteAgent, RemoteAgentConfig
 from moya.classifiers.llm_classifier import LLMClassifier
@@ -9,6 +12,16 @@ from moya.memory.in_memory_repository import InMemoryRepository
 from moya.tools.tool_registry import ToolRegistry
 
 
+# Messages that open with an explicit joke request ("tell me a joke",
+# "cuéntame un chiste") are routed straight to the joke agent, skipping the
+# classifier's LLM call; anything else that merely mentions jokes is classified
+JOKE_REQUEST_PATTERN = re.compile(
+    r"^\s*(please\s+)?(tell|give)\s+me\s+(a\s+|another\s+|some\s+)?jokes?\b"
+    r"|^\s*(por\s+favor\s+)?cu[eé]ntame\s+(un\s+|otro\s+)?chistes?\b",
+    re.IGNORECASE
+)
+
+
 def setup_memory_components():
     """Set up memory components for the agents."""
     tool_registry = ToolRegistry()
@@ -16,7 +29,7 @@ def setup_memory_components():
     return tool_registry
 
 
-def create_english_agent(tool_registry):
+def create_english_agent(tool_registry, client=None):
     """Create an English-speaking OpenAI agent."""
     agent_config = OpenAIAgentConfig(
         agent_name="english_agent",
@@ -28,13 +41,14 @@ def create_english_agent(tool_registry):
             'temperature': 0.7,
         },
         model_name="gpt-4o",
-        api_key=os.getenv("OPENAI_API_KEY")
+        api_key=os.getenv("OPENAI_API_KEY"),
+        client=client
     )
 
     return OpenAIAgent(config=agent_config)
 
 
-def create_spanish_agent(tool_registry) -> OpenAIAgent:
+def create_spanish_agent(tool_registry, client=None) -> OpenAIAgent:
     """Create a Spanish-speaking OpenAI agent."""
     agent_config = OpenAIAgentConfig(
         agent_name="spanish_agent",
@@ -47,7 +61,8 @@ def create_spanish_agent(tool_registry) -> OpenAIAgent:
             'temperature': 0.7
         },
         model_name="gpt-4o",
-        api_key=os.getenv("OPENAI_API_KEY")
+        api_key=os.getenv("OPENAI_API_KEY"),
+        client=client
     )
 
     return OpenAIAgent(config=agent_config)
@@ -70,7 +85,7 @@ def create_remote_agent(tool_registry) -> RemoteAgent:
 
 
 
-def create_classifier_agent() -> OpenAIAgent:
+def create_classifier_agent(client=None) -> OpenAIAgent:
     """Create a classifier agent for language and task detection."""
 
     system_prompt="""You are a classifier. Your job is to determine the best agent based on the user's message:
@@ -87,9 +102,10 @@ def create_classifier_agent() -> OpenAIAgent:
         agent_type="AgentClassifier",
         description="Language and task classifier for routing messages",
         tool_registry=None,
-        model_name="gpt-4o",    
+        model_name="gpt-4o-mini",  # Routing is a single-label decision; a small model is enough
         system_prompt=system_prompt,
-        api_key=os.getenv("OPENAI_API_KEY")
+        api_key=os.getenv("OPENAI_API_KEY"),
+        client=client
     )
 
     return OpenAIAgent(config=agent_config)
@@ -100,12 +116,14 @@ def setup_orchestrator():
     """Set up the multi-agent orchestrator with all components."""
     # Set up shared components
     tool_registry = setup_memory_components()
+    # One OpenAI client for every agent, so they share a single connection pool
+    openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
     # Create agents
-    english_agent = create_english_agent(tool_registry)
-    spanish_agent = create_spanish_agent(tool_registry)
+    english_agent = create_english_agent(tool_registry, client=openai_client)
+    spanish_agent = create_spanish_agent(tool_registry, client=openai_client)
     joke_agent = create_remote_agent(tool_registry)
-    classifier_agent = create_classifier_agent()
+    classifier_agent = create_classifier_agent(client=openai_client)
 
     # Set up agent registry
     registry = AgentRegistry()
@@ -128,11 +146,11 @@ def setup_orchestrator():
 
 def format_conversation_context(messages):
     """Format conversation history for context."""
-    context = "\nPrevious conversation:\n"
+    lines = []
     for msg in messages:
-        sender = "User" if msg.sender == "user" else "Assistant"
-        context += f"{sender}: {msg.content}\n"
-    return context
+        sender = "User" if msg["role"] == "user" else "Assistant"
+        lines.append(f"{sender}: {msg['content']}\n")
+    return "\nPrevious conversation:\n" + "".join(lines)
 
 
 def main():
@@ -144,6 +162,11 @@ def main():
     print("You can chat in English or Spanish, or request responses in either language.")
     print("-" * 50)
 
+    # Recent raw turns for the prompt context. MultiAgentOrchestrator already stores
+    # every turn in EphemeralMemory, but it stores the context-enriched prompt, so
+    # summarising those back would nest all earlier context inside each new prompt
+    recent_messages = deque(maxlen=5)
+
     def stream_callback(chunk):
         print(chunk, end="", flush=True)
 
@@ -158,30 +181,28 @@ def main():
             print("\nGoodbye!")
             break
 
-        # Get available agents
-        agents = orchestrator.agent_registry.list_agents()
-        if not agents:
-            print("\nNo agents available!")
-            continue
+        # Add context to the user's message if there are previous messages
+        if recent_messages:
+            context = format_conversation_context(recent_messages)
+            enriched_input = f"{context}\nCurrent user message: {user_message}"
+        else:
+            enriched_input = user_message
 
-        # Get the last used agent or default to the first one
-        last_agent = orchestrator.agent_registry.get_agent(agents[0].name)
-
-        # Store the user message first
-        EphemeralMemory.store_message(thread_id=thread_id, sender="user", content=user_message) 
-
-        session_summary = EphemeralMemory.get_thread_summary(thread_id)
-        enriched_input = f"{session_summary}\nCurrent user message: {user_message}"
+        # Match only the new message, not the history in the summary
+        route = {"agent_name": "joke_agent"} if JOKE_REQUEST_PATTERN.search(user_message) else {}
 
         # Print Assistant prompt and get response
         print("\nAssistant: ", end="", flush=True)
         response = orchestrator.orchestrate(
             thread_id=thread_id,
             user_message=enriched_input,
-            stream_callback=stream_callback
+            stream_callback=stream_callback,
+            **route
         )
         print()  # New line after response
-        EphemeralMemory.store_message(thread_id=thread_id, sender="system", content=response)
+
+        recent_messages.append({"role": "user", "content": user_message})
+        recent_messages.append({"role": "assistant", "content": response})
 
 
 if __name__ == "__main__":
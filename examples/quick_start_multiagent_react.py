@@ -147,11 +147,11 @@ def setup_orchestrator():
 
 def format_conversation_context(messages):
     """Format conversation history for context."""
-    context = "\nPrevious conversation:\n"
+    lines = []
     for msg in messages:
         sender = "User" if msg.sender == "user" else "Assistant"
-        context += f"{sender}: {msg.content}\n"
-    return context
+        lines.append(f"{sender}: {msg.content}\n")
+    return "\nPrevious conversation:\n" + "".join(lines)
 
 
 def main():
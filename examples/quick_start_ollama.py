@@ -3,6 +3,7 @@ Interactive chat example using Ollama agent with conversation memory.
 """
 
 import sys
+import json
 from moya.memory.in_memory_repository import InMemoryRepository
 from moya.tools.tool_registry import ToolRegistry
 from moya.tools.ephemeral_memory import EphemeralMemory
@@ -61,11 +62,11 @@ def setup_agent():
 
 
 def format_conversation_context(messages):
-    context = "\nPrevious conversation:\n"
+    lines = []
     for msg in messages:
-        sender = "User" if msg.sender == "user" else "Assistant"
-        context += f"{sender}: {msg.content}\n"
-    return context
+        sender = "User" if msg["role"] == "user" else "Assistant"
+        lines.append(f"{sender}: {msg['content']}\n")
+    return "\nPrevious conversation:\n" + "".join(lines)
 
 
 def main():
@@ -85,18 +86,13 @@ def main():
             print("\nGoodbye!")
             break
 
-        # Store user message
-        session_memory.append_message(thread_id, Message(thread_id=thread_id, sender="user",content=user_input))
+        # Store user message and get conversation context in one call
+        previous_messages = json.loads(EphemeralMemory.store_message_and_get_last_n(
+            thread_id=thread_id, sender="user", content=user_input, n=5
+        ))
 
-        # Get conversation context
-        thread = session_memory.get_thread(thread_id)
-        previous_messages = thread.get_last_n_messages(n=5)
-
-        if previous_messages:
-            context = format_conversation_context(previous_messages)
-            enhanced_input = f"{context}\nCurrent user message: {user_input}"
-        else:
-            enhanced_input = user_input
+        context = format_conversation_context(previous_messages)
+        enhanced_input = f"{context}\nCurrent user message: {user_input}"
 
         try:
             print("\nAssistant: ", end="", flush=True)
@@ -52,12 +52,12 @@ def setup_agent():
 
 
 def format_conversation_context(messages):
-    context = "\nPrevious conversation:\n"
+    lines = []
     for msg in messages:
         # Access Message object attributes properly using dot notation
         sender = "User" if msg.sender == "user" else "Assistant"
-        context += f"{sender}: {msg.content}\n"
-    return context
+        lines.append(f"{sender}: {msg.content}\n")
+    return "\nPrevious conversation:\n" + "".join(lines)
 
 
 def main():
@@ -77,10 +77,8 @@ def main():
             print("\nGoodbye!")
             break
 
-        # Store user message
-        EphemeralMemory.store_message(thread_id=thread_id, sender="user", content=user_input)
-    
-        session_summary = EphemeralMemory.get_thread_summary(thread_id)
+        # Store user message and fetch the updated summary in one call
+        session_summary = EphemeralMemory.store_message_and_get_summary(thread_id=thread_id, sender="user", content=user_input)
         enriched_input = f"{session_summary}\nCurrent user message: {user_input}"
 
         # Print Assistant prompt
@@ -1,9 +1,10 @@
-import asyncio
 import uvicorn
 import os
+import json
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 
@@ -15,6 +16,9 @@ from moya.tools.ephemeral_memory import EphemeralMemory
 app = FastAPI()
 security = HTTPBearer()
 
+# Characters of the reply sent per streamed event, rather than one event per character
+STREAM_CHUNK_CHARS = 64
+
 # Configure your bearer token
 VALID_TOKEN = None #"your-secret-token-here"
 
@@ -80,8 +84,9 @@ async def chat(request: Request):
     # Store user message
     EphemeralMemory.store_message(thread_id=thread_id, sender="user", content=message)
 
-    # Get response from agent
-    response = agent.handle_message(message, thread_id=thread_id)
+    # Get response from agent in the threadpool, as /chat/stream does, so the
+    # blocking LLM call doesn't stall the event loop
+    response = await run_in_threadpool(agent.handle_message, message, thread_id=thread_id)
 
     # Store agent response
     EphemeralMemory.store_message(thread_id=thread_id, sender=agent.agent_name, content=response)
@@ -101,20 +106,24 @@ async def chat_stream(request: Request):
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Content-Type": "text/event-stream",
-            "Transfer-Encoding": "chunked"
+            "Connection": "keep-alive"
         }
     )
 
 
+def format_event(text: str) -> str:
+    """Frame text as one SSE event, JSON-encoded so newlines stay on a single data: line."""
+    return f"data:{json.dumps(text)}\n\n"
+
+
 async def stream_response(message: str, thread_id: str):
     """Stream response from OpenAI agent."""
     try:
-        for chunk in agent.handle_message_stream(message, thread_id=thread_id):
-            if chunk:
-                yield f"data:{chunk}\n"
-                await asyncio.sleep(0.01)
+        # OpenAIAgent produces the whole reply in one blocking call (LLM round-trips
+        # plus tool calls), so run it in the threadpool to keep the event loop free
+        text = await run_in_threadpool(agent.handle_message, message, thread_id=thread_id)
+        for start in range(0, len(text), STREAM_CHUNK_CHARS):
+            yield format_event(text[start:start + STREAM_CHUNK_CHARS])
     except Exception as e:
         yield f"data: [Error: {str(e)}]\n\n"
 
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentInfo():
     "A class that holds information about an agent"
     name: str
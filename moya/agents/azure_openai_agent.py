@@ -43,26 +43,27 @@ class AzureOpenAIAgent(OpenAIAgent):
         super().__init__(config=config)
         if not config.api_base:
             raise ValueError("Azure OpenAI API base is required for AzureOpenAIAgent.")
-        api_base = config.api_base 
 
         if not config.api_version:
             raise ValueError("Azure OpenAI API version is required for AzureOpenAIAgent.")
-        
 
-        
+    def _create_client(self):
+        """
+        Create the AzureOpenAI client, using either the configured API key
+        or an Azure AD token provider.
+        """
+        config = self.config
         if config.use_azure_ad_token_provider:
             token_provider = get_bearer_token_provider(
                 DefaultAzureCredential(), "https://cognitiveservices.azure.com/.default"
             )
 
-            self.client = AzureOpenAI( 
-                                  azure_endpoint=api_base, 
-                                  api_version=config.api_version,
-                                  azure_ad_token_provider=token_provider,
-                                  organization=config.organization)
-        else:
-            self.client = AzureOpenAI(api_key=config.api_key,
-                                  azure_endpoint=api_base,
-                                  api_version=config.api_version,
-                                  organization=config.organization)
-        
+            return AzureOpenAI(azure_endpoint=config.api_base,
+                               api_version=config.api_version,
+                               azure_ad_token_provider=token_provider,
+                               organization=config.organization)
+
+        return AzureOpenAI(api_key=config.api_key,
+                           azure_endpoint=config.api_base,
+                           api_version=config.api_version,
+                           organization=config.organization)
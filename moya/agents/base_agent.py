@@ -22,6 +22,19 @@ from dataclasses import dataclass
 from moya.tools.base_tool import BaseTool
 from moya.tools.tool_registry import ToolRegistry
 from moya.memory.base_repository import BaseMemoryRepository
+
+
+# Default LLM parameters, defined once and merged into every AgentConfig
+_DEFAULT_LLM_CONFIG = {
+    'model_name': "default",
+    'temperature': 0.7,
+    'max_tokens':  2000,
+    'top_p': 1.0,
+    'frequency_penalty': 0.0,
+    'presence_penalty': 0.0,
+}
+
+
 @dataclass
 class AgentConfig:
     """
@@ -42,16 +55,8 @@ class AgentConfig:
             raise ValueError("Agent name must be provided.")
         if not self.description:
             raise ValueError("Agent description must be provided.")
-        default_llm_config = {
-                'model_name': "default",
-                'temperature': 0.7,
-                'max_tokens':  2000,
-                'top_p': 1.0,
-                'frequency_penalty': 0.0,
-                'presence_penalty': 0.0,
-                'stop_sequences':  [],
-        }
-        self.llm_config = {**default_llm_config, **(self.llm_config or {})}
+        # stop_sequences is mutable, so every config gets its own list
+        self.llm_config = {**_DEFAULT_LLM_CONFIG, 'stop_sequences': [], **(self.llm_config or {})}
 
 
 
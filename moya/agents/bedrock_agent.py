@@ -60,43 +60,46 @@ class BedrockAgent(Agent):
                 f"Failed to initialize Bedrock client: {str(e)}"
             )
 
+    def _build_request_body(self, message: str) -> Dict[str, Any]:
+        """
+        Construct the invoke_model request body for the configured model.
+        """
+        if "anthropic.claude-3" in self.model_id:
+            # Use Messages API format for Claude 3 models
+            return {
+                "anthropic_version": "bedrock-2023-05-31",
+                "max_tokens": self.config.llm_config.get('max_tokens', 1000),
+                "temperature": self.config.llm_config.get('temperature', 0.7),
+                "messages": [
+                    {
+                        "role": "assistant",
+                        "content": self.system_prompt
+                    },
+                    {
+                        "role": "user",
+                        "content": message
+                    }
+                ]
+            }
+        elif "anthropic" in self.model_id:
+            # Legacy format for older Claude models
+            prompt = f"\n\nHuman: {message}\n\nAssistant:"
+            return {
+                "prompt": self.system_prompt + prompt,
+                "max_tokens_to_sample": self.config.llm_config.get('max_tokens', 1000),
+                "temperature": self.config.llm_config.get('temperature', 0.7)
+            }
+        # Handle other model types here
+        return {
+            "inputText": message
+        }
+
     def handle_message(self, message: str, **kwargs) -> str:
         """
         Calls AWS Bedrock to handle the user's message.
         """
         try:
-            # Construct the request based on the model
-            if "anthropic.claude-3" in self.model_id:
-                # Use Messages API format for Claude 3 models
-                body = {
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": self.config.llm_config.get('max_tokens', 1000),
-                    "temperature": self.config.llm_config.get('temperature', 0.7),
-                    "messages": [
-                        {
-                            "role": "assistant",
-                            "content": self.system_prompt
-                        },
-                        {
-                            "role": "user",
-                            "content": message
-                        }
-                    ]
-                }
-            elif "anthropic" in self.model_id:
-                # Legacy format for older Claude models
-                prompt = f"\n\nHuman: {message}\n\nAssistant:"
-                body = {
-                    "prompt": self.system_prompt + prompt,
-                    "max_tokens_to_sample": self.config.llm_config.get('max_tokens', 1000),
-                    "temperature": self.config.llm_config.get('temperature', 0.7)
-                }
-            else:
-                # Handle other model types here
-                body = {
-                    "inputText": message
-                }
-                
+            body = self._build_request_body(message)
             response = self.client.invoke_model(
                 modelId=self.model_id,
                 body=json.dumps(body)
@@ -117,36 +120,7 @@ class BedrockAgent(Agent):
         Calls AWS Bedrock to handle the user's message with streaming support.
         """
         try:
-            if "anthropic.claude-3" in self.model_id:
-                # Use Messages API format for Claude 3 models
-                body = {
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": self.config.llm_config.get('max_tokens', 1000),
-                    "temperature": self.config.llm_config.get('temperature', 0.7),
-                    "messages": [
-                        {
-                            "role": "assistant",
-                            "content": self.system_prompt
-                        },
-                        {
-                            "role": "user",
-                            "content": message
-                        }
-                    ]
-                }
-            elif "anthropic" in self.model_id:
-                # Legacy format for older Claude models
-                prompt = f"\n\nHuman: {message}\n\nAssistant:"
-                body = {
-                    "prompt": self.system_prompt + prompt,
-                    "max_tokens_to_sample": self.config.llm_config.get('max_tokens', 1000),
-                    "temperature": self.config.llm_config.get('temperature', 0.7)
-                }
-            else:
-                body = {
-                    "inputText": message
-                }
-                
+            body = self._build_request_body(message)
             response = self.client.invoke_model_with_response_stream(
                 modelId=self.model_id,
                 body=json.dumps(body)
@@ -7,7 +7,6 @@ import os
 from dataclasses import dataclass
 
 from crewai import Agent as CrewAgent, LLM as CrewLLM, Task as CrewTask, Crew
-from typing import Any, Dict, Optional
 from moya.agents.base_agent import Agent, AgentConfig
 
 os.environ["OTEL_SDK_DISABLED"] = "true"
@@ -15,7 +14,10 @@ os.environ["OTEL_SDK_DISABLED"] = "true"
 
 @dataclass
 class CrewAIAgentConfig(AgentConfig):
-    api_key: str = os.getenv("OPENAI_API_KEY"),
+    """
+    Configuration data for a CrewAIAgent.
+    """
+    api_key: str = os.getenv("OPENAI_API_KEY")
     model_name: str = "gpt-4o"
 
 
@@ -26,29 +28,15 @@ class CrewAIAgent(Agent):
 
     def __init__(
             self,
-            agent_name: str,
-            description: str,
-            config: Optional[Dict[str, Any]] = None,
-            tool_registry: Optional[Any] = None,
-            agent_config: Optional[CrewAIAgentConfig] = None
+            config: CrewAIAgentConfig
     ):
         """
-        :param agent_name: Unique name or identifier for the agent.
-        :param description: A brief explanation of the agent's capabilities.
-        :param config: Optional agent configuration (unused by default).
-        :param tool_registry: Optional ToolRegistry to enable tool calling.
-        :param system_prompt: Default system prompt for context.
-        :param agent_config: Optional configuration for the CrewAIAgent.
+        Initialize the CrewAIAgent.
+
+        :param config: Configuration for the agent.
         """
-        super().__init__(
-            agent_name=agent_name,
-            agent_type="CrewAIAgent",
-            description=description,
-            config=config,
-            tool_registry=tool_registry
-        )
-        self.agent_config = agent_config or CrewAIAgentConfig()
-        self.system_prompt = self.agent_config.system_prompt
+        super().__init__(config=config)
+        self.agent_config = config
         self.client = None
 
     def setup(self) -> None:
@@ -26,8 +26,10 @@ class OllamaAgent(Agent):
         super().__init__(agent_config)
         self.base_url = self.llm_config["base_url"] or ""
         self.model_name = self.llm_config["model_name"] or "llama3.1"
+        # Reuse one HTTP connection to the Ollama server across requests
+        self.session = requests.Session()
         try:
-            response = requests.get(f"{self.base_url}/api/tags")
+            response = self.session.get(f"{self.base_url}/api/tags")
             if response.status_code != 200:
                 raise ConnectionError("Unable to connect to Ollama server")
         except Exception as e:
@@ -42,7 +44,7 @@ class OllamaAgent(Agent):
             # Combine system prompt and user message
             prompt = f"{self.system_prompt}\n\nUser: {message}\nAssistant:"
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model_name,
@@ -64,7 +66,7 @@ class OllamaAgent(Agent):
             # Combine system prompt and user message
             prompt = f"{self.system_prompt}\n\nUser: {message}\nAssistant:"
             
-            response = requests.post(
+            with self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model_name,
@@ -72,19 +74,24 @@ class OllamaAgent(Agent):
                     "stream": True
                 },
                 stream=True
-            )
-            response.raise_for_status()
-            
-            for line in response.iter_lines():
-                if line:
-                    try:
-                        chunk = json.loads(line.decode('utf-8'))
-                        if "response" in chunk:
-                            yield chunk["response"]
-                    except json.JSONDecodeError:
-                        continue
+            ) as response:
+                response.raise_for_status()
+                
+                for line in response.iter_lines():
+                    if line:
+                        try:
+                            chunk = json.loads(line.decode('utf-8'))
+                            if "response" in chunk:
+                                yield chunk["response"]
+                        except json.JSONDecodeError:
+                            continue
                             
         except Exception as e:
             error_message = f"[OllamaAgent error: {str(e)}]"
             print(error_message)
             yield error_message
+
+    def __del__(self):
+        """Cleanup the session when the agent is destroyed."""
+        if hasattr(self, 'session'):
+            self.session.close()
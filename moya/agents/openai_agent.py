@@ -26,6 +26,8 @@ class OpenAIAgentConfig(AgentConfig):
     model_name: str = "gpt-4o"
     api_key: str = None
     tool_choice: Optional[str] = None
+    # Optional pre-built OpenAI client, so several agents can share one connection pool
+    client: Optional[Any] = None
 
 class OpenAIAgent(Agent):
     """
@@ -42,14 +44,35 @@ class OpenAIAgent(Agent):
         :param config: Configuration for the agent.
         """
         super().__init__(config=config)
+        self.config = config
         self.model_name = config.model_name
-        if not config.api_key:
+        if not config.api_key and config.client is None:
             raise ValueError("OpenAI API key is required for OpenAIAgent.")
-        self.client = OpenAI(api_key=config.api_key)
+        self._client = config.client
         self.system_prompt = config.system_prompt
         self.tool_choice = config.tool_choice if config.tool_choice else None
         self.max_iterations = 5
 
+    @property
+    def client(self):
+        """
+        The OpenAI client, created on first use so that constructing an
+        agent does not pay for client setup until it is actually called.
+        """
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+
+    def _create_client(self):
+        """
+        Create the OpenAI client for this agent.
+        """
+        return OpenAI(api_key=self.config.api_key)
+
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
         """
         Discover tools available for this agent.
@@ -64,19 +87,7 @@ class OpenAIAgent(Agent):
             "function": {
                 "name": tool.name,
                 "description": tool.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        name: {
-                            "type": info["type"],
-                            "description": info["description"]
-                        } for name, info in tool.parameters.items()
-                    },
-                    "required": [
-                        name for name, info in tool.parameters.items() 
-                        if info.get("required", False)
-                    ]
-                }
+                "parameters": tool.get_parameters_schema()
             }
         }
         for tool in self.tool_registry.get_tools()
@@ -167,15 +178,17 @@ class OpenAIAgent(Agent):
                 tool_choice=self.tool_choice if self.tool_registry else None,
                 stream=True
             )
-            response_text = ""
+            # Collect streamed fragments and join them once at the end
+            content_parts = []
             tool_calls = []
+            argument_parts = []
             current_tool_call = None
             
             for chunk in response:
                 delta = chunk.choices[0].delta
                 if delta:
                     if delta.content is not None:
-                        response_text += delta.content
+                        content_parts.append(delta.content)
                         
                     if delta.tool_calls:
                         for tool_call_delta in delta.tool_calls:
@@ -184,6 +197,7 @@ class OpenAIAgent(Agent):
                             # Ensure we have enough slots in our tool_calls list
                             while len(tool_calls) <= tool_call_index:
                                 tool_calls.append({"id": "", "type": "function", "function": {"name": "", "arguments": ""}})
+                                argument_parts.append([])
                                 
                             current_tool_call = tool_calls[tool_call_index]
                             
@@ -196,12 +210,12 @@ class OpenAIAgent(Agent):
                                     current_tool_call["function"]["name"] = tool_call_delta.function.name
                                     
                                 if tool_call_delta.function.arguments:
-                                    current_tool_call["function"]["arguments"] = (
-                                        current_tool_call["function"].get("arguments", "") + 
-                                        tool_call_delta.function.arguments
-                                    )
-            
-            result = {"content": response_text}
+                                    argument_parts[tool_call_index].append(tool_call_delta.function.arguments)
+
+            for tool_call, parts in zip(tool_calls, argument_parts):
+                tool_call["function"]["arguments"] = "".join(parts)
+
+            result = {"content": "".join(content_parts)}
             if tool_calls:
                 result["tool_calls"] = tool_calls
             return result
@@ -4,6 +4,7 @@ RemoteAgent for Moya.
 An Agent that communicates with a remote API endpoint to generate responses.
 """
 
+import json
 import requests
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, Iterator
@@ -114,7 +115,7 @@ class RemoteAgent(Agent):
                 
                 for line in response.iter_lines(decode_unicode=True):
                     if line and line.startswith("data:"):
-                        content = line[5:]
+                        content = self._decode_chunk(line[5:])
                         if content and content != "done":
                             yield content
                     
@@ -123,6 +124,21 @@ class RemoteAgent(Agent):
             print(error_message)
             yield error_message
 
+    @staticmethod
+    def _decode_chunk(data: str) -> str:
+        """
+        Decode one data: payload. Servers may send a chunk as a JSON string so it can
+        carry newlines on a single line; anything else is passed through unchanged.
+        """
+        if data.startswith('"') and data.endswith('"') and len(data) > 1:
+            try:
+                decoded = json.loads(data)
+            except ValueError:
+                return data
+            if isinstance(decoded, str):
+                return decoded
+        return data
+
     def __del__(self):
         """Cleanup the session when the agent is destroyed."""
         if hasattr(self, 'session'):
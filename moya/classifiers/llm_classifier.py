@@ -45,7 +45,7 @@ class LLMClassifier(BaseClassifier):
         # Clean up response and validate
         selected_agent = response.strip()
 
-        if selected_agent not in [agent.name for agent in available_agents]:
+        if selected_agent not in {agent.name for agent in available_agents}:
             return self.default_agent
 
         return selected_agent
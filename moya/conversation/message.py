@@ -24,6 +24,9 @@ class Message:
                          (e.g., role info, model parameters, etc.).
     """
 
+    # One Message is created per conversation turn, so skip the per-instance __dict__
+    __slots__ = ("message_id", "thread_id", "sender", "content", "timestamp", "metadata")
+
     def __init__(
         self,
         thread_id: str,
@@ -7,13 +7,17 @@ as JSON files and messages as JSON lines within those files.
 
 import os
 import json
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Optional, List, Any, Union
+from typing import Dict, Optional, List, Any, Tuple, Union
 from moya.conversation.thread import Thread
 from moya.conversation.message import Message
 from moya.memory.base_repository import BaseMemoryRepository
 
 
+# Maximum number of parsed threads kept in memory per repository
+THREAD_CACHE_SIZE = 64
+
 class FileSystemRepository(BaseMemoryRepository):
     """
     Maintains threads as JSON files on disk.
@@ -25,6 +29,10 @@ class FileSystemRepository(BaseMemoryRepository):
         """Initialize the repository with a base directory path."""
         self.base_path = base_path
         os.makedirs(base_path, exist_ok=True)
+        # Parsed threads keyed by thread_id, tagged with the file's (mtime_ns, size)
+        # so an unchanged file is not re-read and re-parsed on every get_thread.
+        # Kept in least-recently-used order and capped at THREAD_CACHE_SIZE entries
+        self._thread_cache: "OrderedDict[str, Tuple[Tuple[int, int], Thread]]" = OrderedDict()
     
     def _thread_file_path(self, thread_id: str) -> str:
         """Get the file path for a thread"""
@@ -49,45 +57,56 @@ class FileSystemRepository(BaseMemoryRepository):
         # Write thread metadata and initial messages if any
         with open(file_path, 'w') as f:
             json.dump(thread_data, f)
+            f.write("\n")
             if thread.messages:
-                f.write("\n")
-                for msg in thread.messages:
-                    # Use raw message data for storage to preserve original format
-                    raw_data = {
+                # Use raw message data for storage to preserve original format
+                f.writelines(
+                    json.dumps({
                         "message_id": msg.message_id,
                         "thread_id": msg.thread_id,
                         "sender": msg.sender,
                         "content": msg.content,
                         "timestamp": msg.timestamp.isoformat() if hasattr(msg, 'timestamp') else datetime.utcnow().isoformat(),
                         "metadata": msg.metadata or {}
-                    }
-                    f.write(json.dumps(raw_data) + "\n")
+                    }) + "\n"
+                    for msg in thread.messages
+                )
 
     def get_thread(self, thread_id: str) -> Optional[Thread]:
         """
         Retrieve a thread by ID or return None if not found.
         """
         file_path = self._thread_file_path(thread_id)
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self._thread_cache.pop(thread_id, None)
             return None
+
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._thread_cache.get(thread_id)
+        if cached and cached[0] == file_version:
+            self._thread_cache.move_to_end(thread_id)
+            return self._copy_thread(cached[1])
         
         try:
             # Read the thread file
             messages = []
             with open(file_path, 'r') as f:
-                lines = f.readlines()
+                # Iterate the file lazily so only one line is held in memory at a time
+                header = next(f, None)
                 
-                if not lines:
+                if header is None:
                     return Thread(thread_id=thread_id, metadata={})
                 
                 # First line contains thread metadata
                 try:
-                    thread_data = json.loads(lines[0])
-                except (json.JSONDecodeError, IndexError):
+                    thread_data = json.loads(header)
+                except json.JSONDecodeError:
                     thread_data = {"thread_id": thread_id, "metadata": {}}
                 
                 # Remaining lines are messages
-                for line in lines[1:]:
+                for line in f:
                     if not line.strip():  # Skip empty lines
                         continue
                     
@@ -103,6 +122,7 @@ class FileSystemRepository(BaseMemoryRepository):
                                 message_id=msg_data.get("message_id"),
                                 sender=msg_data["sender"],
                                 content=content,
+                                timestamp=self._parse_timestamp(msg_data.get("timestamp")),
                                 metadata=msg_data.get("metadata", {})
                             ))
                     except Exception as e:
@@ -115,24 +135,54 @@ class FileSystemRepository(BaseMemoryRepository):
             for msg in messages:
                 thread.add_message(msg)
                 
-            return thread
+            self._cache_thread(thread_id, file_version, thread)
+            return self._copy_thread(thread)
             
         except Exception as e:
             # Return an empty thread as fallback
             print(f"Error loading thread {thread_id}: {e}")
             return Thread(thread_id=thread_id, metadata={})
 
+    def _cache_thread(self, thread_id: str, file_version: Tuple[int, int], thread: Thread) -> None:
+        """Cache a parsed thread, evicting the least recently used one when full"""
+        self._thread_cache[thread_id] = (file_version, thread)
+        self._thread_cache.move_to_end(thread_id)
+        if len(self._thread_cache) > THREAD_CACHE_SIZE:
+            self._thread_cache.popitem(last=False)
+
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+        """Parse a stored ISO timestamp, or return None if it is missing or invalid"""
+        try:
+            return datetime.fromisoformat(value) if value else None
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _copy_thread(thread: Thread) -> Thread:
+        """Return a copy of a cached thread and its messages so callers can't mutate the cache"""
+        copy = Thread(thread_id=thread.thread_id, participants=list(thread.participants), metadata=dict(thread.metadata))
+        copy.messages = [FileSystemRepository._copy_message(msg) for msg in thread.messages]
+        return copy
+
+    @staticmethod
+    def _copy_message(message: Message, thread_id: Optional[str] = None) -> Message:
+        """Return a copy of a message, optionally re-homed to the given thread"""
+        return Message(
+            thread_id=thread_id or message.thread_id,
+            sender=message.sender,
+            content=message.content,
+            message_id=message.message_id,
+            timestamp=message.timestamp,
+            metadata=dict(message.metadata or {})
+        )
+
     def append_message(self, thread_id: str, message: Message) -> None:
         """
         Append a message to an existing thread. Creates the thread if it doesn't exist.
         """
         file_path = self._thread_file_path(thread_id)
         
-        # Create thread file if it doesn't exist
-        if not os.path.exists(file_path):
-            thread = Thread(thread_id=thread_id)
-            self.create_thread(thread)
-        
         try:
             # Store raw message data format
             raw_data = {
@@ -145,7 +195,26 @@ class FileSystemRepository(BaseMemoryRepository):
             }
             
             with open(file_path, 'a') as f:
+                stat = os.fstat(f.fileno())
+                cached = self._thread_cache.get(thread_id)
+                # An empty file means the thread is new, so write its metadata line first
+                # (this avoids a separate existence check on every append)
+                if f.tell() == 0:
+                    cached = ((stat.st_mtime_ns, stat.st_size), Thread(thread_id=thread_id, metadata={}))
+                    json.dump({"thread_id": thread_id, "metadata": {}}, f)
+                    f.write("\n")
                 f.write(json.dumps(raw_data) + "\n")
+                f.flush()
+
+                # Keep the cached thread current when it matched the file before this write,
+                # so reading a thread back after appending to it doesn't re-parse the file
+                if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+                    thread = cached[1]
+                    thread.add_message(self._copy_message(message, thread_id=thread_id))
+                    stat = os.fstat(f.fileno())
+                    self._cache_thread(thread_id, (stat.st_mtime_ns, stat.st_size), thread)
+                else:
+                    self._thread_cache.pop(thread_id, None)
         except Exception as e:
             raise ValueError(f"Failed to append message to thread {thread_id}: {str(e)}")
 
@@ -153,9 +222,10 @@ class FileSystemRepository(BaseMemoryRepository):
         """Return a list of all thread IDs"""
         thread_ids = []
         try:
-            for filename in os.listdir(self.base_path):
-                if filename.endswith(".json"):
-                    thread_ids.append(filename[:-5])  # Remove .json extension
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        thread_ids.append(entry.name[:-5])  # Remove .json extension
         except OSError:
             # Handle directory access errors
             pass
@@ -164,6 +234,7 @@ class FileSystemRepository(BaseMemoryRepository):
     def delete_thread(self, thread_id: str) -> None:
         """Delete a thread file if it exists"""
         file_path = self._thread_file_path(thread_id)
+        self._thread_cache.pop(thread_id, None)
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
@@ -69,7 +69,7 @@ class MultiAgentOrchestrator(BaseOrchestrator):
         if stream_callback:
             # Send agent prefix first
             stream_callback(agent_prefix)
-            response = agent_prefix
+            response_parts = [agent_prefix]
             
             message_stream = agent.handle_message_stream(user_message, thread_id=thread_id, **kwargs)
             if message_stream is None:
@@ -77,7 +77,8 @@ class MultiAgentOrchestrator(BaseOrchestrator):
 
             for chunk in message_stream:
                 stream_callback(chunk)
-                response += chunk
+                response_parts.append(chunk)
+            response = "".join(response_parts)
         else:
             agent_response = agent.handle_message(user_message, thread_id=thread_id, **kwargs)
             response = agent_prefix + agent_response
@@ -7,6 +7,7 @@ An implementation of an orchestrator that follows the ReAct framework:
 - Observation: Automatically generated based on the responses of the assistants.
 """
 
+import re
 from typing import Optional
 
 from moya.agents.base_agent import Agent
@@ -16,6 +17,10 @@ from moya.classifiers.base_classifier import BaseClassifier
 import os
 
 
+# Matches the "task: " / "Task: " label the LLM tends to echo back
+_TASK_LABEL_RE = re.compile(r"[Tt]ask: ")
+
+
 class ReActOrchestrator(BaseOrchestrator):
     """
     An orchestrator that follows the ReAct framework to handle user messages.
@@ -82,7 +87,7 @@ class ReActOrchestrator(BaseOrchestrator):
         if not agent_name:
             agent_name = self.default_agent_name
         task = self._generate_task(thought, agent_name)
-        task = task.replace("task: ", "").replace("Task: ", "").strip()
+        task = _TASK_LABEL_RE.sub("", task).strip()
         action = f"  agent: {agent_name}\n  task: {task}"
 
         self.log(message=f"{thought}\n{action}")
@@ -116,7 +121,7 @@ class ReActOrchestrator(BaseOrchestrator):
         """
         Parse the action string to extract the agent name and task description.
         """
-        lines = action.split('\n')
+        lines = action.splitlines()
         agent_name = lines[0].split(': ')[1]
         task_description = lines[1].split(': ')[1]
         return agent_name, task_description
@@ -152,11 +157,7 @@ class ReActOrchestrator(BaseOrchestrator):
         Generate the observation based on the agent's response.
         """
         observation = f"Observation: {response}"
-        temp_obs = observation.replace("\n", " ")
-        if len(observation) > 100:
-            self.log(message=temp_obs[:50] + "..." + temp_obs[-50:])
-        else:
-            self.log(message=temp_obs)
+        self.log(message=observation, truncate=True)
         return observation
 
     def _generate_final_answer(self, response: str) -> str:
@@ -165,14 +166,22 @@ class ReActOrchestrator(BaseOrchestrator):
         """
         return response.replace("Observation: ", "")
 
-    def log(self, message: str):
+    def log(self, message: str, truncate: bool = False):
         """
         Log the iteration message.
+
+        :param truncate: Flatten the message onto one line and shorten it to its
+            first and last 50 characters if it is longer than 100.
         """
         if self.verbose:
-            messages = message.split('\n')
-            for message in messages:
-                cleaned_message = message.replace("\n", "").strip()
+            if truncate:
+                temp_message = message.replace("\n", " ")
+                if len(message) > 100:
+                    message = temp_message[:50] + "..." + temp_message[-50:]
+                else:
+                    message = temp_message
+            for message in message.splitlines():
+                cleaned_message = message.strip()
                 if cleaned_message == 'new_line':
                     print("\n")
                 elif cleaned_message:
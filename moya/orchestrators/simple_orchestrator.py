@@ -68,14 +68,15 @@ class SimpleOrchestrator(BaseOrchestrator):
 
         # 3. Let the agent handle the message with streaming support
         if stream_callback:
-            response = ""
+            response_parts = []
             message_stream = agent.handle_message_stream(user_message, thread_id=thread_id, **kwargs)
             if message_stream is None:
                 message_stream = []
 
             for chunk in message_stream:
                 stream_callback(chunk)
-                response += chunk
+                response_parts.append(chunk)
+            response = "".join(response_parts)
         else:
             response = agent.handle_message(user_message, thread_id=thread_id, **kwargs)
 
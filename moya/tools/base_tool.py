@@ -5,9 +5,14 @@ Describes a generic interface for a "tool" that an agent can discover and call.
 """
 
 import abc
+import re
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, get_type_hints
 
+
+# Matches a "- name: description" parameter line (exactly one colon) in a docstring
+_DOC_PARAM_RE = re.compile(r"^\s*- ([^:\n]*):([^:\n]*)$", re.MULTILINE)
+
 @dataclass
 class BaseTool():
     name: str
@@ -50,27 +55,27 @@ class BaseTool():
         
         if self.parameters is None:
             self.parameters = {}
-            for line in docstring.split("\n"):
-                if line.strip().startswith("- "):
-                    parts = line.strip().split(":")
-                    if len(parts) == 2:
-                        param_name, param_desc = parts
-                        param_name = param_name.strip().replace("- ", "")
-                        if param_name and param_name == "self":
-                            continue
+            doc_params = _DOC_PARAM_RE.findall(docstring)
+            # Resolve the type hints once rather than once per documented parameter,
+            # and only when there is a parameter to look up
+            type_hints = get_type_hints(self.function) if doc_params else {}
+            for param_name, param_desc in doc_params:
+                param_name = param_name.strip().replace("- ", "")
+                if param_name and param_name == "self":
+                    continue
 
-                        if "Optional" in param_name:
-                            # Remove "Optional" from parameter name
-                            param_name = param_name.replace("Optional", "").strip()
-                    
-                        param_desc = param_desc.strip()
-                        param_type = get_type_hints(self.function).get(param_name, Any)
-                        param_json_type = json_type_map.get(param_type, "string")
+                if "Optional" in param_name:
+                    # Remove "Optional" from parameter name
+                    param_name = param_name.replace("Optional", "").strip()
+            
+                param_desc = param_desc.strip()
+                param_type = type_hints.get(param_name, Any)
+                param_json_type = json_type_map.get(param_type, "string")
 
-                        self.parameters[param_name] = {
-                            "type": param_json_type,
-                            "description": param_desc
-                        }
+                self.parameters[param_name] = {
+                    "type": param_json_type,
+                    "description": param_desc
+                }
         else:
         # Validate parameters format if provided
             self._validate_parameters(self.parameters)
@@ -98,7 +103,24 @@ class BaseTool():
                 raise ValueError(f"Parameter {param_name} has invalid type. Must be one of: {', '.join(valid_types)}")
 
 
-    
+    def get_parameters_schema(self) -> Dict[str, Any]:
+        """
+        Returns the JSON schema for the tool's parameters, shared by all provider formats.
+        """
+        return {
+            "type": "object",
+            "properties": {
+                name: {
+                    "type": info["type"],
+                    "description": info["description"]
+                } for name, info in self.parameters.items()
+            },
+            "required": [
+                name for name, info in self.parameters.items() 
+                if info.get("required", False)
+            ]
+        }
+
     def get_bedrock_definition(self) -> Dict[str, Any]:
         """
         Returns the tool definition in a format compatible with Bedrock.
@@ -106,19 +128,7 @@ class BaseTool():
         return {
             "name": self.name,
             "description": self.description,
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    name: {
-                        "type": info["type"],
-                        "description": info["description"]
-                    } for name, info in self.parameters.items()
-                },
-                "required": [
-                    name for name, info in self.parameters.items() 
-                    if info.get("required", False)
-                ]
-            }
+            "parameters": self.get_parameters_schema()
         }
     
     def get_openai_definition(self) -> Dict[str, Any]:
@@ -131,19 +141,7 @@ class BaseTool():
             "function": {
                 "name": self.name,
                 "description": self.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        name: {
-                            "type": info["type"],
-                            "description": info["description"]
-                        } for name, info in self.parameters.items()
-                    },
-                    "required": [
-                        name for name, info in self.parameters.items() 
-                        if info.get("required", False)
-                    ]
-                }
+                "parameters": self.get_parameters_schema()
             }
         }
     
@@ -12,6 +12,7 @@ from moya.memory.in_memory_repository import InMemoryRepository
 from moya.conversation.thread import Thread
 from moya.conversation.message import Message
 import json
+import threading
 
 
 class EphemeralMemory:
@@ -26,6 +27,9 @@ class EphemeralMemory:
     """
 
     memory_repository = InMemoryRepository()
+    # Serialises appends so concurrent turns (e.g. a threaded server) can't race
+    # to create the same thread or snapshot a half-updated history
+    _append_lock = threading.Lock()
 
     @staticmethod
     def store_message(
@@ -44,20 +48,38 @@ class EphemeralMemory:
             - content: The message content.
             - metadata: Optional metadata dictionary.
         """
-        existing_thread = EphemeralMemory.memory_repository.get_thread(thread_id)
-        if not existing_thread:
-            # Create the thread on the fly if it doesn't exist
-            new_thread = Thread(thread_id=thread_id)
-            EphemeralMemory.memory_repository.create_thread(new_thread)
+        EphemeralMemory._append_message(thread_id, sender, content, metadata)
+        return f"Message stored in thread {thread_id}."
 
+    @staticmethod
+    def _append_message(
+        thread_id: str,
+        sender: str,
+        content: str,
+        metadata: Optional[dict] = None
+    ) -> List[Message]:
+        """
+        Append a message to the specified thread, creating the thread on the fly
+        if it doesn't exist. Returns the thread's messages from before the append
+        followed by the new message.
+        """
         message = Message(
             thread_id=thread_id,
             sender=sender,
             content=content,
             metadata=metadata
         )
-        EphemeralMemory.memory_repository.append_message(thread_id, message)
-        return f"Message stored in thread {thread_id}."
+
+        with EphemeralMemory._append_lock:
+            thread = EphemeralMemory.memory_repository.get_thread(thread_id)
+            if not thread:
+                thread = Thread(thread_id=thread_id)
+                EphemeralMemory.memory_repository.create_thread(thread)
+
+            # Copy the history before appending, since some repositories return a snapshot
+            history = list(thread.messages)
+            EphemeralMemory.memory_repository.append_message(thread_id, message)
+        return history + [message]
 
     @staticmethod
     def get_last_n_messages(thread_id: str, n: int = 5) -> str:
@@ -75,7 +97,34 @@ class EphemeralMemory:
         
         # Return a JSON representation of the messages
         return json.dumps([message.to_dict() for message in messages])
-    
+
+    @staticmethod
+    def store_message_and_get_last_n(
+        thread_id: str,
+        sender: str,
+        content: str,
+        n: int = 5,
+        metadata: Optional[dict] = None
+    ) -> str:
+        """
+        Store a message in the specified thread and retrieve the last N messages,
+        including the one just stored, in a single call.
+
+        Parameters:
+            - thread_id: Unique identifier for the conversation thread.
+            - sender: Sender of the message (e.g., 'user', 'agent').
+            - content: The message content.
+            - n: Number of messages to retrieve (default: 5).
+            - metadata: Optional metadata dictionary.
+        """
+        messages = EphemeralMemory._append_message(thread_id, sender, content, metadata)
+        # Same slicing as Thread.get_last_n_messages, so n == 0 returns the whole thread
+        # and a negative n drops the first |n| messages, as get_last_n_messages does
+        messages = messages[-n:]
+
+        # Return a JSON representation of the messages
+        return json.dumps([message.to_dict() for message in messages])
+
 
     @staticmethod
     def get_thread_summary(thread_id: str) -> str:
@@ -90,12 +139,35 @@ class EphemeralMemory:
         if not thread:
             return ""
 
-        # For demonstration, we'll just build a naive bullet-point summary
-        lines = []
-        for msg in thread.messages:
-            lines.append(f"{msg.sender} said: {msg.content}")
+        return EphemeralMemory._format_summary(thread_id, thread.messages)
 
-        summary = "\n".join(lines)
+    @staticmethod
+    def store_message_and_get_summary(
+        thread_id: str,
+        sender: str,
+        content: str,
+        metadata: Optional[dict] = None
+    ) -> str:
+        """
+        Store a message in the specified thread and return the thread summary,
+        including the message just stored, in a single call.
+
+        Parameters:
+            - thread_id: Unique identifier for the conversation thread.
+            - sender: Sender of the message (e.g., 'user', 'agent').
+            - content: The message content.
+            - metadata: Optional metadata dictionary.
+        """
+        messages = EphemeralMemory._append_message(thread_id, sender, content, metadata)
+        return EphemeralMemory._format_summary(thread_id, messages)
+
+    @staticmethod
+    def _format_summary(thread_id: str, messages: List[Message]) -> str:
+        """
+        Build the naive summary text for the given thread messages.
+        """
+        # For demonstration, we'll just build a naive bullet-point summary
+        summary = "\n".join(f"{msg.sender} said: {msg.content}" for msg in messages)
         return f"Summary of thread {thread_id}:\n{summary}"
 
     @staticmethod
@@ -109,3 +181,5 @@ class EphemeralMemory:
         tool_registry.register_tool(BaseTool(name="Store", function = EphemeralMemory.store_message))
         tool_registry.register_tool(BaseTool(name="get_last_n", function=EphemeralMemory.get_last_n_messages))
         tool_registry.register_tool(BaseTool(name="get_summary", function=EphemeralMemory.get_thread_summary))
+        tool_registry.register_tool(BaseTool(name="store_and_get_last_n", function=EphemeralMemory.store_message_and_get_last_n))
+        tool_registry.register_tool(BaseTool(name="store_and_get_summary", function=EphemeralMemory.store_message_and_get_summary))